@@ -4,118 +4,327 @@
 import shutil
 import os
 import json
+import re
+import sys
+import tempfile
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, unquote
 
 # Third-party library imports (need to be installed)
 import click
 from colorama import init, Fore, Back, Style
 import send2trash
 
+# Rows of the workspace listings, precomposed so a listing is written at once
+ROW_FMT = (
+    f"{Fore.LIGHTGREEN_EX}%d: {Fore.LIGHTMAGENTA_EX}%s"
+    f"{Fore.LIGHTRED_EX} [%.2f MB]{Fore.BLUE} (%s){Fore.RESET}\n"
+)
+SELECTED_ROW_FMT = (
+    f"{Fore.LIGHTMAGENTA_EX}%s{Fore.LIGHTRED_EX} [%.2f MB]{Fore.BLUE} (%s){Fore.RESET}\n"
+)
+NO_SIZE_ROW_FMT = f"{Fore.LIGHTGREEN_EX}%d: {Fore.LIGHTMAGENTA_EX}%s{Fore.BLUE} (%s){Fore.RESET}\n"
+NO_SIZE_SELECTED_ROW_FMT = f"{Fore.LIGHTMAGENTA_EX}%s{Fore.BLUE} (%s){Fore.RESET}\n"
+
 
 class VsCodeCacheClean:
     CHECK_FOLDERS = ["Code", "Code - OSS"]
     WORKSPACE_STORAGE_PATH = "User/workspaceStorage/"
     WORKSPACE_FILE = "workspace.json"
-
-    def __init__(self, path, dry_run):
+    # Only matches an empty authority, URIs with a host are skipped by the JSON fallback
+    FOLDER_RE = re.compile(rb'"folder"\s*:\s*"file://(/[^"\\]*)"')
+    SELECTION_RE = re.compile(r"(\d+)(?:-(\d+))?")
+    SELECTION_INPUT_RE = re.compile(r"\s*\d+(?:-\d+)?(?:\s+\d+(?:-\d+)?)*\s*")
+    MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    REMOVE_WORKERS = 8
+    INDEX_FILE = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+        "vscode-cache-clean",
+        "index.json",
+    )
+
+    def __init__(self, path, dry_run, fast_delete=False, no_size=False):
         """
         Initialize the class
         Args:
             path (str): Path to the vscode cache folder
             dry_run (bool): Flag to do a dry run. If True, nothing will be deleted
+            fast_delete (bool): Flag to delete folders without shutil.rmtree's race and top-level symlink protection
+            no_size (bool): Flag to skip computing the size of the cached folders
         """
         self.dry_run = dry_run
+        self.fast_delete = fast_delete
+        self.no_size = no_size
         self.path = path
-        self.non_existent_workspaces = {}
+        # The workspace storage folders only depend on the path, so they are
+        # joined once up front
+        self.storage_roots = tuple(
+            os.path.join(path, folder, self.WORKSPACE_STORAGE_PATH)
+            for folder in self.CHECK_FOLDERS
+        )
+        self.non_existent_workspaces = []
+        self.print_lock = threading.Lock()
+        self.index = self._load_index()
+        # Only needed on Windows, where the ANSI escapes have to be translated
         init()
 
-    def _get_workspace_from_folder(self, folder: str) -> str:
+    def _load_index(self) -> dict:
+        """
+        Load the index of previously scanned cache folders
+        Returns:
+            dict: Dictionary of the previously scanned cache folders
+        """
+        try:
+            with open(self.INDEX_FILE, "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _save_index(self) -> None:
         """
-        Get the workspace path from cache data
+        Atomically write the index of scanned cache folders to disk
+        """
+        index_dir = os.path.dirname(self.INDEX_FILE)
+        tmp_file = None
+        try:
+            os.makedirs(index_dir, exist_ok=True)
+            # A unique temporary file, so concurrent runs don't clobber each other
+            with tempfile.NamedTemporaryFile(
+                "w", dir=index_dir, suffix=".tmp", delete=False
+            ) as f:
+                tmp_file = f.name
+                json.dump(self.index, f)
+            os.replace(tmp_file, self.INDEX_FILE)
+        except OSError as e:
+            print(Fore.YELLOW + f"Could not save index {self.INDEX_FILE}: {e}" + Fore.RESET)
+            if tmp_file:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+
+    def _read_workspace_file(self, folder: str) -> str:
+        """
+        Get the workspace path from the workspace file of a cache folder
         Args:
             folder (str): Path to the cache folder
         Returns:
             str: Path to the workspace
         """
-        workspace_file = os.path.join(folder, self.WORKSPACE_FILE)
-        raw_json = ""
-        if os.path.exists(workspace_file):
-            with open(workspace_file, "r") as f:
+        try:
+            # Cache folders come from DirEntry.path and never end with a separator
+            with open(f"{folder}{os.sep}{self.WORKSPACE_FILE}", "rb") as f:
                 raw_json = f.read()
-
-        if raw_json:
-            try:
-                json_folder = json.loads(raw_json)["folder"]
-                return json_folder[7:]  # Remove the "file://" from the path
-            except json.JSONDecodeError:
-                print(Fore.RED + f"Error decoding JSON for {folder}" + Fore.RESET)
+        except OSError:
+            # Opening directly saves a separate existence check
+            return ""
+
+        # Fast path for the plain "file://" URI VSCode writes, without
+        # building the whole JSON object
+        match = self.FOLDER_RE.search(raw_json)
+        if not match and not raw_json:
+            return ""
+
+        # ValueError covers both JSONDecodeError and UnicodeDecodeError, as
+        # the file is read as bytes
+        try:
+            if match:
+                return unquote(match.group(1).decode())
+
+            json_folder = json.loads(raw_json).get("folder", "")
+            # Only URIs need parsing, plain paths are used as they are
+            if json_folder.startswith("file://"):
+                url = urlparse(json_folder)
+                # A host (e.g. a network share or wsl.localhost) can't be
+                # mapped to a local path, so it's treated like a remote workspace
+                if url.netloc:
+                    return ""
+                return unquote(url.path)
+            # Remote workspaces (vscode-remote:// and other schemes) can't
+            # be checked against the local file system
+            if "://" in json_folder:
                 return ""
-        return ""
+            return json_folder
+        except (ValueError, AttributeError):
+            # Runs in the scan's worker threads
+            self._print(Fore.RED + f"Error decoding JSON for {folder}" + Fore.RESET)
+            return ""
 
     def _get_size_of_folder(self, folder: str) -> int:
         """
-        Get the size of the folder by looping through all the files and subfolders
+        Get the size of the folder by recursively scanning all the files and subfolders
         Args:
             folder (str): Path to the folder
         Returns:
             int: Size of the folder in bytes
         """
         size_on_disk = 0
-        for root, dirs, files in os.walk(folder):
-            size_on_disk += sum(
-                os.path.getsize(os.path.join(root, name)) for name in files
-            )
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    # DirEntry caches the type from the directory listing, so
+                    # only regular files cost an extra stat call
+                    if entry.is_dir(follow_symlinks=False):
+                        size_on_disk += self._get_size_of_folder(entry.path)
+                    else:
+                        size_on_disk += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            # Matches os.walk, which silently skips unreadable folders
+            pass
         return size_on_disk
 
-    def _find_all_workspaces(self, in_path) -> dict:
+    def _get_indexed_workspace(self, entry: os.DirEntry) -> tuple:
+        """
+        Get the index entry of a cache folder, reading the workspace file only
+        if the cache folder was modified since the last scan
+        Args:
+            entry (os.DirEntry): Directory entry of the cache folder
+        Returns:
+            tuple: Path to the cache folder and its index entry, or None if
+                the cache folder disappeared since it was listed
+        """
+        folder = entry.path
+        # DirEntry caches the stat result, and on Windows it comes for free
+        # with the directory listing
+        try:
+            mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+        except OSError:
+            return None
+        cached = self.index.get(folder)
+        # Entries of a corrupted or hand-edited index count as a cache miss
+        if (
+            isinstance(cached, dict)
+            and type(cached.get("mtime_ns")) is int
+            and cached["mtime_ns"] == mtime_ns
+            and isinstance(cached.get("workspace"), str)
+        ):
+            return folder, cached
+        return folder, {
+            "mtime_ns": mtime_ns,
+            "workspace": self._read_workspace_file(folder),
+        }
+
+    def _get_indexed_size(self, folder: str) -> tuple:
+        """
+        Get the size of a cache folder, reusing the indexed size if there is one
+        Args:
+            folder (str): Path to the cache folder
+        Returns:
+            tuple: Path to the cache folder and its size in bytes
+        """
+        size = self.index[folder].get("size")
+        if type(size) is not int:
+            size = self._get_size_of_folder(folder)
+        return folder, size
+
+    def _list_cache_folders(self, root: str) -> list:
         """
-        Finds all the cached folders in the cache folder
+        Lists all the cached folders in a workspace storage folder
         Args:
-            in_path (str): Path to the cache folder
+            root (str): Path to the workspace storage folder
+        Returns:
+            list: Directory entries of all the cached folders in the workspace storage folder
+        """
+        with os.scandir(root) as it:
+            return [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+
+    def _find_all_workspaces(self) -> dict:
+        """
+        Finds all the cached folders in the workspace storage folders
         Returns:
             dict: Dictionary of all the cached folders
         """
-        ret = {}
-        for folder in self.CHECK_FOLDERS:
-            dir = os.path.join(in_path + folder, self.WORKSPACE_STORAGE_PATH)
+        cache_folders = []
+        for dir in self.storage_roots:
             try:
-                folder_name = [f for f in os.listdir(dir)]
+                cache_folders.extend(self._list_cache_folders(dir))
             except FileNotFoundError:
                 print(Fore.YELLOW + f"Folder {dir} not found. Skipping..." + Fore.RESET)
                 continue
-            for f in folder_name:
-                ret.update(
-                    {
-                        os.path.join(dir, f): {
-                            "workspace": self._get_workspace_from_folder(
-                                os.path.join(dir, f)
-                            ),
-                            "size": self._get_size_of_folder(os.path.join(dir, f)),
-                        }
-                    }
-                )
-        return ret
 
-    def _find_non_existent_workspaces(self, cached_folder_path: dict) -> dict:
+        # Cached folders are independent and scanning them is I/O bound,
+        # so the syscalls of several folders can overlap
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            self.index = dict(
+                item
+                for item in executor.map(self._get_indexed_workspace, cache_folders)
+                if item is not None
+            )
+
+        return {
+            folder: {"workspace": entry["workspace"]}
+            for folder, entry in self.index.items()
+        }
+
+    def _find_non_existent_workspaces(self, cached_folder_path: dict) -> list:
         """
-        Loops over all the cached folders and finds the worlspaces that don't exist
+        Loops over all the cached folders and finds the worlspaces that don't exist.
+        Sizes are only computed for the non-existent workspaces, as they are
+        the only ones that get displayed
         Args:
             cached_folder_path (dict): Dictionary of all the cached folders
         Returns:
-            dict: Dictionary of all the non-existent workspaces
+            list: Cached folder paths and workspace data of all the non-existent workspaces
         """
-        ret = {}
+        # Group the workspaces by parent folder, so a single listing of the
+        # parent replaces a stat call per workspace
+        by_parent = defaultdict(list)
         for folder, workspace in cached_folder_path.items():
-            if not os.path.exists(workspace["workspace"]):
-                ret.update({folder: workspace})
+            # Without a local folder (missing or malformed workspace.json,
+            # multi-root or remote workspace) there is nothing to check, so
+            # it's skipped and never offered for deletion
+            if not workspace["workspace"]:
+                continue
+            path = os.path.normpath(workspace["workspace"])
+            by_parent[os.path.dirname(path)].append((folder, os.path.basename(path)))
+
+        missing = set()
+        for parent, entries in by_parent.items():
+            try:
+                with os.scandir(parent) as it:
+                    names = {entry.name for entry in it}
+            except OSError:
+                names = set()
+            for folder, name in entries:
+                # Double check misses, as the listing is case sensitive even
+                # on case insensitive file systems
+                if name not in names and not os.path.exists(
+                    cached_folder_path[folder]["workspace"]
+                ):
+                    missing.add(folder)
+
+        # VSCode can still write anywhere inside the cache folder of an
+        # existing workspace without changing the folder's mtime, so its
+        # indexed size can't be trusted later on
+        for folder in cached_folder_path:
+            if folder not in missing:
+                self.index[folder].pop("size", None)
+
+        ret = [
+            (folder, workspace)
+            for folder, workspace in cached_folder_path.items()
+            if folder in missing
+        ]
+        if self.no_size:
+            return ret
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            sizes = executor.map(self._get_indexed_size, (folder for folder, _ in ret))
+            for (folder, workspace), (_, size) in zip(ret, sizes):
+                workspace["size"] = size
+                self.index[folder]["size"] = size
         return ret
 
-    def _scan(self) -> dict:
+    def _scan(self) -> list:
         """
         Scans the cache folder and finds all the non-existent workspaces
         Returns:
-            dict: Dictionary of all the non-existent workspaces
+            list: Cached folder paths and workspace data of all the non-existent workspaces
         """
-        all_cache_data = self._find_all_workspaces(self.path)
+        all_cache_data = self._find_all_workspaces()
 
         if not all_cache_data:
             print(
@@ -125,15 +334,59 @@ class VsCodeCacheClean:
             )
             exit(0)
 
-        return self._find_non_existent_workspaces(all_cache_data)
+        non_existent_workspaces = self._find_non_existent_workspaces(all_cache_data)
+        self._save_index()
+        return non_existent_workspaces
+
+    def _print_workspaces(self, workspaces: list, numbered: bool) -> None:
+        """
+        Print a listing of workspaces followed by their total size. Sizes are
+        left out if they weren't computed
+        Args:
+            workspaces (list): Cached folder paths and workspace data of the workspaces
+            numbered (bool): Flag to number the rows for selection
+        """
+        if self.no_size:
+            if numbered:
+                rows = (
+                    NO_SIZE_ROW_FMT % (i + 1, workspace["workspace"], folder)
+                    for i, (folder, workspace) in enumerate(workspaces)
+                )
+            else:
+                rows = (
+                    NO_SIZE_SELECTED_ROW_FMT % (workspace["workspace"], folder)
+                    for folder, workspace in workspaces
+                )
+            sys.stdout.write("".join(rows) + "\n")
+            return
+
+        if numbered:
+            rows = (
+                ROW_FMT % (i + 1, workspace["workspace"], workspace["size"] / 1048576, folder)
+                for i, (folder, workspace) in enumerate(workspaces)
+            )
+        else:
+            rows = (
+                SELECTED_ROW_FMT % (workspace["workspace"], workspace["size"] / 1048576, folder)
+                for folder, workspace in workspaces
+            )
+        sys.stdout.write("".join(rows))
+        sum_size = sum(w["size"] for _, w in workspaces)
+
+        print(
+            Fore.LIGHTYELLOW_EX
+            + f"\nTotal size of {'' if numbered else 'selected '}non-existent workspaces: "
+            + f"{sum_size / 1024 / 1024:.2f} MB, {sum_size / 1024 / 1024 / 1024:.2f} GB\n"
+            + Fore.RESET
+        )
 
-    def _get_user_input(self, non_existent_workspaces: dict) -> dict:
+    def _get_user_input(self, non_existent_workspaces: list) -> list:
         """
         Get user input on which folders to delete
         Args:
-            non_existent_workspaces (dict): Dictionary of all the non-existent workspaces
+            non_existent_workspaces (list): Cached folder paths and workspace data of all the non-existent workspaces
         Returns:
-            dict: Dictionary of all the folders to delete
+            list: Cached folder paths and workspace data of all the folders to delete
         """
         
         if not non_existent_workspaces:
@@ -155,37 +408,18 @@ class VsCodeCacheClean:
             + f" <<< Non existing workspace path >>> "
             + Fore.RESET
             + "|"
-            + Fore.LIGHTRED_EX
-            + f" <<< Cached dir size >>> "
-            + Fore.RESET
-            + "|"
+            + (
+                ""
+                if self.no_size
+                else Fore.LIGHTRED_EX + f" <<< Cached dir size >>> " + Fore.RESET + "|"
+            )
             + Fore.BLUE
             + f" <<< Cached dir path >>> "
             + Fore.RESET
             + "|"
         )
 
-        sum_size = 0
-        for i, (folder, workspace) in enumerate(non_existent_workspaces.items()):
-            print(
-                Fore.LIGHTGREEN_EX
-                + f"{i+1}: "
-                + Fore.LIGHTMAGENTA_EX
-                + f"{workspace['workspace']}"
-                + Fore.LIGHTRED_EX
-                + f" [{workspace['size'] / 1024 / 1024:.2f} MB]"
-                + Fore.BLUE
-                + f" ({folder})"
-                + Fore.RESET
-            )
-            sum_size += workspace["size"]
-
-        print(
-            Fore.LIGHTYELLOW_EX
-            + "\nTotal size of non-existent workspaces: "
-            + f"{sum_size / 1024 / 1024:.2f} MB, {sum_size / 1024 / 1024 / 1024:.2f} GB\n"
-            + Fore.RESET
-        )
+        self._print_workspaces(non_existent_workspaces, numbered=True)
         print(
             Fore.LIGHTGREEN_EX
             + "Type 'a' to delete all, 'n' to exit or 'd' to selectively delete (select numbers)"
@@ -209,48 +443,24 @@ class VsCodeCacheClean:
                 Fore.LIGHTGREEN_EX + "You can also input a range like 1-3" + Fore.RESET
             )
             user_input = input(">>> ")
-            try:
-                user_input = user_input.split(" ")
-
-                selected_folders = []
-                for i in user_input:
-                    if "-" in i:
-                        start, end = i.split("-")
-                        selected_folders.extend(range(int(start), int(end) + 1))
-                    else:
-                        selected_folders.append(int(i))
-            except ValueError:
+            if not self.SELECTION_INPUT_RE.fullmatch(user_input):
                 print(Fore.LIGHTRED_EX + "Invalid input. Exiting" + Fore.RESET)
                 exit(0)
 
-            selected_folders = list(set(selected_folders))
+            selected_folders = set()
+            for match in self.SELECTION_RE.finditer(user_input):
+                start = int(match.group(1))
+                end = int(match.group(2)) if match.group(2) else start
+                selected_folders.update(range(start, end + 1))
 
-            non_existent_workspaces = {
-                k: v
-                for i, (k, v) in enumerate(non_existent_workspaces.items())
-                if i + 1 in selected_folders
-            }
+            non_existent_workspaces = [
+                non_existent_workspaces[i - 1]
+                for i in sorted(selected_folders)
+                if 1 <= i <= len(non_existent_workspaces)
+            ]
 
             print(Fore.LIGHTGREEN_EX + "Selected Folders:" + Fore.RESET)
-            sum_size = 0
-            for folder, workspace in non_existent_workspaces.items():
-                print(
-                    Fore.LIGHTMAGENTA_EX
-                    + f"{workspace['workspace']}"
-                    + Fore.LIGHTRED_EX
-                    + f" [{workspace['size'] / 1024 / 1024:.2f} MB]"
-                    + Fore.BLUE
-                    + f" ({folder})"
-                    + Fore.RESET
-                )
-                sum_size += workspace["size"]
-
-            print(
-                Fore.LIGHTYELLOW_EX
-                + "\nTotal size of selected non-existent workspaces: "
-                + f"{sum_size / 1024 / 1024:.2f} MB, {sum_size / 1024 / 1024 / 1024:.2f} GB\n"
-                + Fore.RESET
-            )
+            self._print_workspaces(non_existent_workspaces, numbered=False)
             print(
                 Fore.LIGHTGREEN_EX
                 + "Do you want to delete the above folders? (y/n)"
@@ -271,11 +481,93 @@ class VsCodeCacheClean:
             print(Fore.LIGHTRED_EX + "Invalid input. Exiting" + Fore.RESET)
             exit(0)
 
-    def _remove_folders(self, for_removal: dict) -> None:
+    def _print(self, message: str) -> None:
+        """
+        Print a message without interleaving it with messages of other threads
+        Args:
+            message (str): Message to print
+        """
+        with self.print_lock:
+            print(message)
+
+    def _trash_folder(self, item: tuple) -> None:
+        """
+        Move a cached folder to trash
+        Args:
+            item (tuple): Path to the cached folder and its workspace data
+        """
+        folder, workspace = item
+        self._print(
+            Fore.LIGHTGREEN_EX + f"Moving {workspace['workspace']} to trash" + Fore.RESET
+        )
+        try:
+            send2trash.send2trash(folder)
+        except Exception as e:
+            self._print(
+                Fore.LIGHTRED_EX
+                + f"Error moving {workspace['workspace']} to trash: {e}"
+                + Fore.RESET
+            )
+
+    def _fast_rmtree(self, folder: str, on_error) -> None:
+        """
+        Recursively delete a folder. Symlinks are unlinked, not followed, but
+        unlike shutil.rmtree there is no fd-based protection against the tree
+        changing during the walk, and a top-level symlink isn't refused
+        Args:
+            folder (str): Path to the folder
+            on_error (callable): Called with the failing function, path and exception
+        """
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        self._fast_rmtree(entry.path, on_error)
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                    except OSError as e:
+                        on_error(os.unlink, entry.path, e)
+        except OSError as e:
+            on_error(os.scandir, folder, e)
+        try:
+            os.rmdir(folder)
+        except OSError as e:
+            on_error(os.rmdir, folder, e)
+
+    def _delete_folder(self, item: tuple) -> None:
+        """
+        Permanently delete a cached folder, deleting as much of it as possible
+        when some of its files can't be removed
+        Args:
+            item (tuple): Path to the cached folder and its workspace data
+        """
+        folder, workspace = item
+        self._print(Fore.LIGHTGREEN_EX + f"Deleting {workspace['workspace']}" + Fore.RESET)
+
+        errors = []
+
+        def on_error(func, path, exc):
+            # onexc passes the exception, the older onerror passes exc_info
+            errors.append(exc if isinstance(exc, BaseException) else exc[1])
+
+        if self.fast_delete:
+            self._fast_rmtree(folder, on_error)
+        elif sys.version_info >= (3, 12):
+            shutil.rmtree(folder, onexc=on_error)
+        else:
+            shutil.rmtree(folder, onerror=on_error)
+
+        for e in errors:
+            self._print(
+                Fore.LIGHTRED_EX + f"Error deleting {workspace['workspace']}: {e}" + Fore.RESET
+            )
+
+    def _remove_folders(self, for_removal: list) -> None:
         """
         Remove the folders
         Args:
-            for_removal (dict): Dictionary of all the folders to delete
+            for_removal (list): Cached folder paths and workspace data of all the folders to delete
         """
         if self.dry_run:
             print(Fore.LIGHTGREEN_EX + "Dry run. Not deleting anything" + Fore.RESET)
@@ -290,35 +582,14 @@ class VsCodeCacheClean:
         user_input = input(">>> ")
 
         if user_input == "t":
-            for folder, workspace in for_removal.items():
-                print(
-                    Fore.LIGHTGREEN_EX
-                    + f"Moving {workspace['workspace']} to trash"
-                    + Fore.RESET
-                )
-                try:
-                    send2trash.send2trash(folder)
-                except Exception as e:
-                    print(
-                        Fore.LIGHTRED_EX
-                        + f"Error moving {workspace['workspace']} to trash: {e}"
-                        + Fore.RESET
-                    )
+            # send2trash picks a free name in the trash without locking, so
+            # folders with the same hash name could collide if trashed at once
+            for item in for_removal:
+                self._trash_folder(item)
         elif user_input == "d":
-            for folder, workspace in for_removal.items():
-                print(
-                    Fore.LIGHTGREEN_EX
-                    + f"Deleting {workspace['workspace']}"
-                    + Fore.RESET
-                )
-                try:
-                    shutil.rmtree(folder)
-                except Exception as e:
-                    print(
-                        Fore.LIGHTRED_EX
-                        + f"Error deleting {workspace['workspace']}: {e}"
-                        + Fore.RESET
-                    )
+            # The folders are independent trees, so their unlinks can overlap
+            with ThreadPoolExecutor(max_workers=self.REMOVE_WORKERS) as executor:
+                list(executor.map(self._delete_folder, for_removal))
         else:
             print(Fore.LIGHTRED_EX + "Invalid input. Exiting" + Fore.RESET)
             exit(0)
@@ -343,9 +614,24 @@ class VsCodeCacheClean:
     default=False,
     help="Do a dry run. Nothing will be deleted",
 )
+@click.option(
+    "--fast-delete",
+    "-f",
+    is_flag=True,
+    default=False,
+    help="Delete folders with a faster walk that lacks shutil.rmtree's "
+    "protection against races and top-level symlinks",
+)
+@click.option(
+    "--no-size",
+    "-s",
+    is_flag=True,
+    default=False,
+    help="Don't compute the size of the cached folders",
+)
 @click.help_option("-h", "--help")
-def cli(path, dry_run):
-    vsccc = VsCodeCacheClean(path, dry_run)
+def cli(path, dry_run, fast_delete, no_size):
+    vsccc = VsCodeCacheClean(path, dry_run, fast_delete, no_size)
     vsccc.run()
 
 